@@ -1864,32 +1864,42 @@ const translations = {
 };
 
 // t function with parameter support
-const t = (key, params = {}) => {
-  const translation = translations[getCurrentLanguage()][key] || key;
-  
+const t = (key, params) => {
+  const translation = activeTranslations[key] || key;
+
+  // Plain labels (no params) skip the substitution pass entirely
+  if (!params) return translation;
+
   // Replace parameters in the translation
   return Object.keys(params).reduce((result, param) => {
     return result.replace(`{${param}}`, params[param]);
   }, translation);
 };
 
-let currentLanguage = 'es'; // Default to Spanish
+const supportedLanguages = new Set(Object.keys(translations));
 
-const getCurrentLanguage = () => currentLanguage;
+// Active table is rebound on language switch so t() does a single lookup
+let activeTranslations = translations.es; // Default to Spanish
+
+const applyLanguage = (newLanguage) => {
+  activeTranslations = translations[newLanguage] || translations.es;
+};
 
 export const LanguageProvider = ({ children }) => {
   const [language, setLanguageState] = useState(() => {
-    return localStorage.getItem('dinotrack-language') || 'es';
+    const stored = localStorage.getItem('dinotrack-language');
+    return supportedLanguages.has(stored) ? stored : 'es';
   });
 
   const setLanguage = (newLanguage) => {
+    if (!supportedLanguages.has(newLanguage)) return;
     setLanguageState(newLanguage);
-    currentLanguage = newLanguage;
+    applyLanguage(newLanguage);
     localStorage.setItem('dinotrack-language', newLanguage);
   };
 
   useEffect(() => {
-    currentLanguage = language;
+    applyLanguage(language);
   }, [language]);
 
   return (